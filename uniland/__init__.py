@@ -1,7 +1,7 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import scoped_session, selectinload, sessionmaker
 
-from uniland.db.tables import Submission, User, create_tables
+from uniland.db.tables import Submission, User, bookmarks_association, create_tables
 from uniland.utils.search import SearchEngine
 from uniland.utils.usercache import UserCache
 from uniland.utils.uxhandler import UXTree
@@ -16,15 +16,41 @@ def start() -> scoped_session:
     Returns:
         A tuple containing the session, search engine, and user cache.
     """
-    # Creating db engine and session
-    engine = create_engine(DB_URI)
+    # Creating db engine and session; a larger compiled-statement cache keeps
+    # the polymorphic submission queries from being recompiled per request
+    engine = create_engine(DB_URI, query_cache_size=1200, future=True)
     create_tables(engine)
-    session = scoped_session(
-        sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
-    )
+    session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    session = scoped_session(session_factory)
+
+    def load_user(user_id: int):
+        # Imported here since user_methods itself imports this package
+        from uniland.db.user_methods import get_pending_user_step
+
+        # Checked before reading the row: a queued step is newer than the stored one
+        pending_step = get_pending_user_step(user_id)
+        # Uses its own session so a cache miss never closes the caller's session
+        with session_factory() as loader_session:
+            user = loader_session.get(User, user_id)
+            if user is None:
+                return None
+            submissions = Submission.__table__
+            achieved_likes = (
+                loader_session.query(func.count())
+                .select_from(
+                    bookmarks_association.join(
+                        submissions,
+                        submissions.c.id == bookmarks_association.c.submission_id,
+                    )
+                )
+                .filter(submissions.c.owner_id == user_id)
+                .scalar()
+            )
+            last_step = user.last_step if pending_step is None else pending_step
+            return (user.access_level.value, last_step, achieved_likes)
 
     # adding users
-    usercache = UserCache()
+    usercache = UserCache(loader=load_user)
     for user in session.query(User).all():
         usercache.add_user(
             user_id=user.user_id,
@@ -32,9 +58,11 @@ def start() -> scoped_session:
             last_step=user.last_step,
         )
 
-    # Indexing all submissions
+    # Indexing all submissions; likers are batch-loaded since every row reads them
     search_engine = SearchEngine()
-    for submission in session.query(Submission).all():
+    for submission in (
+        session.query(Submission).options(selectinload(Submission.liked_users)).all()
+    ):
         usercache.increase_achieved_likes(
             submission.owner_id, len(submission.liked_users)
         )
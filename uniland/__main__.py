@@ -6,6 +6,8 @@ except Exception as _:
 from pyrogram import Client
 
 from .config import API_HASH, API_ID, BOT_TOKEN
+from .db.submission_methods import start_search_times_flusher
+from .db.user_methods import start_user_steps_flusher
 from .utils import keep_alive
 
 if __name__ == "__main__":
@@ -46,6 +48,9 @@ if __name__ == "__main__":
         ],
     )
 
+    start_search_times_flusher()
+    start_user_steps_flusher()
+
     try:
         uvloop.install()
     except Exception as _:
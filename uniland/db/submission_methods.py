@@ -24,6 +24,12 @@ Functions:
     - increase_search_times(id: int) -> None:
         Increase the search times for a submission with the given ID.
 
+    - flush_search_times() -> None:
+        Writes the pending search times increments to the database in one batch.
+
+    - start_search_times_flusher() -> None:
+        Starts the background thread that periodically flushes search times.
+
     - confirm_user_submission(admin_id: int, submission_id: int) -> None:
         Confirms a user submission by an admin.
 
@@ -43,33 +49,107 @@ Functions:
         Counts the number of confirmed submissions.
 """
 
+import atexit
 import threading
+import time
+from collections import Counter
+from threading import Thread
 from typing import List
 
+from sqlalchemy import bindparam, update
+
 from uniland import SESSION, search_engine, usercache
 from uniland.db import user_methods as user_db
 from uniland.db.tables import Submission
 
-SUBMISSION_INSERTION_LOCK = threading.RLock()
+SEARCH_TIMES_FLUSH_INTERVAL = 1  # seconds
+PENDING_SEARCH_TIMES_LOCK = threading.Lock()
+# Held for a whole flush, so the exit-time flush waits for one in progress
+SEARCH_TIMES_FLUSH_LOCK = threading.Lock()
+PENDING_SEARCH_TIMES = Counter()  # int id -> pending search times
 
 
 def increase_search_times(id: int) -> None:
     """
     Increase the search times for a submission with the given ID.
 
+    The database update is deferred; increments are aggregated in memory and
+    written in one batch by the background flusher.
+
     Args:
         id (int): The ID of the submission.
 
     Returns:
         None
     """
-    with SUBMISSION_INSERTION_LOCK:
-        submission = SESSION.query(Submission).filter(Submission.id == id).first()
-        if submission:
-            submission.search_times += 1
-            search_engine.increase_search_times(id)
-            SESSION.commit()
-        SESSION.close()
+    with PENDING_SEARCH_TIMES_LOCK:
+        PENDING_SEARCH_TIMES[id] += 1
+    if id in search_engine.subs:
+        search_engine.increase_search_times(id)
+
+
+def flush_search_times() -> None:
+    """
+    Write all pending search times increments to the database in one batch.
+
+    Returns:
+        None
+    """
+    global PENDING_SEARCH_TIMES
+    with SEARCH_TIMES_FLUSH_LOCK:
+        with PENDING_SEARCH_TIMES_LOCK:
+            if not PENDING_SEARCH_TIMES:
+                return
+            drained, PENDING_SEARCH_TIMES = PENDING_SEARCH_TIMES, Counter()
+        # Core table statement, so the parameter list runs as a plain executemany
+        submissions = Submission.__table__
+        try:
+            with SESSION() as session:
+                session.connection().execute(
+                    update(submissions)
+                    .where(submissions.c.id == bindparam("sub_id"))
+                    .values(
+                        search_times=submissions.c.search_times + bindparam("amount")
+                    ),
+                    [
+                        {"sub_id": id, "amount": amount}
+                        for id, amount in drained.items()
+                    ],
+                )
+                session.commit()
+        except Exception:
+            # Put the increments back so the next flush retries them
+            with PENDING_SEARCH_TIMES_LOCK:
+                PENDING_SEARCH_TIMES.update(drained)
+            raise
+
+
+def search_times_flusher(interval: float = SEARCH_TIMES_FLUSH_INTERVAL) -> None:
+    """
+    Periodically flushes the pending search times increments.
+
+    Args:
+        interval (float, optional): Seconds between two flushes. Defaults to SEARCH_TIMES_FLUSH_INTERVAL.
+
+    Returns:
+        None
+    """
+    while True:
+        time.sleep(interval)
+        try:
+            flush_search_times()
+        except Exception as e:
+            print(e)
+
+
+def start_search_times_flusher() -> None:
+    """
+    Starts the background flusher of pending search times increments.
+
+    Returns:
+        None
+    """
+    Thread(target=search_times_flusher, daemon=True).start()
 
 
 def confirm_user_submission(admin_id: int, submission_id: int) -> None:
@@ -86,20 +166,19 @@ def confirm_user_submission(admin_id: int, submission_id: int) -> None:
     admin = user_db.get_user(admin_id)
     if admin is None:
         return
-    with SUBMISSION_INSERTION_LOCK:
-        submission = (
-            SESSION.query(Submission).filter(Submission.id == submission_id).first()
+    submission = (
+        SESSION.query(Submission).filter(Submission.id == submission_id).first()
+    )
+    if submission:
+        submission.confirm(admin)
+        search_engine.index_record(
+            id=submission.id,
+            search_text=submission.search_text,
+            sub_type=submission.submission_type,
+            likes=0,
         )
-        if submission:
-            submission.confirm(user_db.get_user(admin_id))
-            search_engine.index_record(
-                id=submission.id,
-                search_text=submission.search_text,
-                sub_type=submission.submission_type,
-                likes=0,
-            )
-            SESSION.commit()
-        SESSION.close()
+        SESSION.commit()
+    SESSION.close()
 
 
 def delete_submission(submission_id: int) -> bool:
@@ -112,41 +191,39 @@ def delete_submission(submission_id: int) -> bool:
     Returns:
         bool: True if the submission is successfully deleted, False otherwise.
     """
-    with SUBMISSION_INSERTION_LOCK:
-        target_submission = (
-            SESSION.query(Submission).filter(Submission.id == submission_id).first()
+    flush_search_times()
+    target_submission = (
+        SESSION.query(Submission).filter(Submission.id == submission_id).first()
+    )
+    # Also decrease search times and achieved likes from usercache and search engine
+    if not target_submission:
+        SESSION.close()
+        return False
+
+    for user in target_submission.liked_users:
+        usercache.decrease_achieved_likes(
+            user.user_id, amount=search_engine.get_likes(target_submission.id)
         )
-        # Also decrease search times and achieved likes from usercache and search engine
-        if not target_submission:
-            SESSION.close()
-            return False
 
-        for user in target_submission.liked_users:
-            usercache.decrease_achieved_likes(
-                user.user_id, amount=search_engine.get_likes(target_submission.id)
-            )
+    total_searches = target_submission.search_times
 
-        total_searches = target_submission.search_times
+    if target_submission.id in search_engine.subs:
+        search_engine.remove_record(target_submission.id)
+    target_submission.liked_users.clear()
+    SESSION.commit()
 
-        if target_submission.id in search_engine.subs:
-            search_engine.remove_record(target_submission.id)
-        target_submission.liked_users.clear()
-        SESSION.commit()
+    for submission in (
+        SESSION.query(Submission).filter(Submission.is_confirmed is True).all()
+    ):
+        if submission.search_times > 0:
+            increase_search_times(submission.id)
+            total_searches -= 1
+            if total_searches <= 0:
+                break
 
-        for submission in (
-            SESSION.query(Submission).filter(Submission.is_confirmed is True).all()
-        ):
-            if submission.search_times > 0:
-                submission.search_times += 1
-                search_engine.increase_search_times(submission.id)
-                total_searches -= 1
-                SESSION.commit()
-                if total_searches <= 0:
-                    break
-
-        SESSION.delete(target_submission)
-        SESSION.commit()
-        return True
+    SESSION.delete(target_submission)
+    SESSION.commit()
+    return True
 
 
 def get_submission(submission_id: int) -> Submission:
@@ -159,13 +236,8 @@ def get_submission(submission_id: int) -> Submission:
     Returns:
         Submission: The submission object.
     """
-    submission = (
-        SESSION.query(Submission).filter(Submission.id == submission_id).first()
-    )
-    SESSION.refresh(submission)
-    SESSION.expunge_all()
-    SESSION.close()
-    return submission
+    with SESSION() as session:
+        return session.get(Submission, submission_id)
 
 
 def get_unconfirmed_submissions() -> List[Submission]:
@@ -222,3 +294,7 @@ def count_confirmed_submissions() -> int:
         int: The number of confirmed submissions.
     """
     return len(search_engine.subs)
+
+
+# Increments still pending when the process exits are written before shutdown
+atexit.register(flush_search_times)
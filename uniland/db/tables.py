@@ -17,11 +17,13 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
+    insert,
 )
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import backref, declarative_base, relationship
 
 from uniland.utils.enums import DocType, UserLevel
 
@@ -33,6 +35,7 @@ bookmarks_association = Table(
     Column("user_id", Integer, ForeignKey("users.user_id")),
     Column("submission_id", Integer, ForeignKey("submissions.id")),
     Column("timestamp", DateTime, default=datetime.utcnow),
+    Index("ix_bookmarks_user_ts", "user_id", "timestamp"),
 )
 
 
@@ -110,6 +113,8 @@ class Submission(BASE):
         __init__(owner, is_confirmed, correspondent_admin, university,
             faculty, owner_title, description):
             Initializes a new instance of the Submission class.
+        bulk_create(session, rows):
+            Inserts many submissions of the class at once.
         update_search_text():
             Updates the search text of the submission.
         confirm(user):
@@ -127,8 +132,7 @@ class Submission(BASE):
     owner_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
     owner = relationship(
         "User",
-        backref="user_submissions",
-        order_by="Submission.submission_date",
+        backref=backref("user_submissions", order_by="Submission.submission_date"),
         foreign_keys=[owner_id],
     )
 
@@ -150,9 +154,24 @@ class Submission(BASE):
 
     submission_type = Column(String(20))
 
+    # constructor defaults, applied by bulk_create since it bypasses __init__
+    _BULK_DEFAULTS = {
+        "university": "نامشخص",
+        "faculty": "نامشخص",
+        "owner_title": "ناشناس",
+        "description": "توضیحاتی برای این فایل ثبت نشده است.",
+    }
+
+    __table_args__ = (
+        Index("ix_submissions_owner_date", "owner_id", "submission_date"),
+        Index("ix_submissions_confirmed_type", "is_confirmed", "submission_type"),
+    )
+
     __mapper_args__ = {
         "polymorphic_identity": "submission",
         "polymorphic_on": submission_type,
+        # load the subclass tables in the same query through LEFT OUTER JOINs
+        "with_polymorphic": "*",
     }
 
     def __init__(
@@ -173,6 +192,32 @@ class Submission(BASE):
         self.owner_title = owner_title
         self.description = description
 
+    @classmethod
+    def bulk_create(cls, session, rows: list) -> list:
+        """
+        Inserts many submissions of this class at once, skipping the unit of work.
+
+        The parent `submissions` row and the subclass row are both written by a
+        single bulk INSERT per table. Intended for imports and backfills; single
+        submissions should keep using the constructor. Columns a row leaves out
+        get the same defaults as the constructor.
+
+        Args:
+            session: The session to execute the insert in. The caller commits.
+            rows (list): Dicts of column values, one per submission.
+
+        Returns:
+            list: The IDs of the inserted submissions.
+        """
+        identity = cls.__mapper__.polymorphic_identity
+        return session.scalars(
+            insert(cls).returning(cls.id),
+            [
+                {**cls._BULK_DEFAULTS, "submission_type": identity, **row}
+                for row in rows
+            ],
+        ).all()
+
     def update_search_text(self):
         """
         Update the search text for the submission.
@@ -184,6 +229,22 @@ class Submission(BASE):
             "This method should not be called from Submission class"
         )
 
+    def _format_fields(self, fields) -> str:
+        """
+        Formats the attributes listed in `fields` that are not set to their sentinel value.
+
+        Args:
+            fields (tuple): `(attribute, sentinel, template)` triples.
+
+        Returns:
+            str: The concatenated templates filled with the attribute values.
+        """
+        return "".join(
+            template.format(value)
+            for attr, sentinel, template in fields
+            if (value := getattr(self, attr)) != sentinel
+        )
+
     def confirm(self, user: User):
         """
         Confirms the submission by updating the admin, confirmation status, and search text.
@@ -232,6 +293,33 @@ class Document(Submission):
     writer = Column(String(30), default="نامشخص")
     semester_year = Column(Integer, default=0)
 
+    _BULK_DEFAULTS = {
+        **Submission._BULK_DEFAULTS,
+        "file_type": DocType.Pamphlet,
+        "course": "نامشخص",
+        "professor": "نامشخص",
+        "writer": "نامشخص",
+        "semester_year": 0,
+    }
+
+    _SEARCH_FIELDS = (
+        ("course", "نامشخص", " درس {}"),
+        ("professor", "نامشخص", " استاد {}"),
+        ("writer", "نامشخص", " نویسنده {}"),
+        ("semester_year", 0, " سال {}"),
+        ("faculty", "نامشخص", " دانشکده {}"),
+        ("university", "نامشخص", " دانشگاه {}"),
+    )
+    _DISPLAY_FIELDS = (
+        ("course", "نامشخص", "درس: {}\n"),
+        ("professor", "نامشخص", "استاد: {}\n"),
+        ("faculty", "نامشخص", "دانشکده: {}\n"),
+        ("university", "نامشخص", "دانشگاه: {}\n"),
+        ("writer", "نامشخص", "نویسنده: {}\n"),
+        ("semester_year", 0, "سال: {}\n"),
+        ("owner_title", "ناشناس", "نام ثبت کننده: {}\n"),
+    )
+
     def __init__(
         self,
         owner,
@@ -277,19 +365,9 @@ class Document(Submission):
         Returns:
             None
         """
-        self.search_text = f"{self.file_type.value}"
-        if self.course != "نامشخص":
-            self.search_text += f" درس {self.course}"
-        if self.professor != "نامشخص":
-            self.search_text += f" استاد {self.professor}"
-        if self.writer != "نامشخص":
-            self.search_text += f" نویسنده {self.writer}"
-        if self.semester_year != 0:
-            self.search_text += f" سال {self.semester_year}"
-        if self.faculty != "نامشخص":
-            self.search_text += f" دانشکده {self.faculty}"
-        if self.university != "نامشخص":
-            self.search_text += f" دانشگاه {self.university}"
+        self.search_text = f"{self.file_type.value}" + self._format_fields(
+            self._SEARCH_FIELDS
+        )
 
     def user_display(self) -> str:
         """
@@ -299,20 +377,7 @@ class Document(Submission):
             str: The formatted string representation of the object.
         """
         out = f"نوع فایل: {self.file_type.value}\n"
-        if self.course != "نامشخص":
-            out += f"درس: {self.course}\n"
-        if self.professor != "نامشخص":
-            out += f"استاد: {self.professor}\n"
-        if self.faculty != "نامشخص":
-            out += f"دانشکده: {self.faculty}\n"
-        if self.university != "نامشخص":
-            out += f"دانشگاه: {self.university}\n"
-        if self.writer != "نامشخص":
-            out += f"نویسنده: {self.writer}\n"
-        if self.semester_year != 0:
-            out += f"سال: {self.semester_year}\n"
-        if self.owner_title != "ناشناس":
-            out += f"نام ثبت کننده: {self.owner_title}\n"
+        out += self._format_fields(self._DISPLAY_FIELDS)
         out += f"توضیحات:\n {self.description}\n"
         out += f"شماره فایل: {self.id}\n"
         return out
@@ -375,6 +440,24 @@ class Profile(Submission):
     phone_number = Column(String(25), default="")
     image_id = Column(String(50), default="")
 
+    _BULK_DEFAULTS = {
+        **Submission._BULK_DEFAULTS,
+        "title": "",
+        "email": "",
+        "phone_number": "",
+        "image_id": "",
+        "description": "توضیحاتی برای این مورد ثبت نشده است.",
+    }
+
+    _SEARCH_FIELDS = (
+        ("faculty", "نامشخص", " دانشکده {}"),
+        ("university", "نامشخص", " دانشگاه {}"),
+    )
+    _DISPLAY_FIELDS = (
+        ("faculty", "نامشخص", "دانشکده: {}\n"),
+        ("university", "نامشخص", "دانشگاه: {}\n"),
+    )
+
     def __init__(
         self,
         owner,
@@ -416,11 +499,9 @@ class Profile(Submission):
         Returns:
         None
         """
-        self.search_text = f"اطلاعات {self.title}"
-        if self.faculty != "نامشخص":
-            self.search_text += f" دانشکده {self.faculty}"
-        if self.university != "نامشخص":
-            self.search_text += f" دانشگاه {self.university}"
+        self.search_text = f"اطلاعات {self.title}" + self._format_fields(
+            self._SEARCH_FIELDS
+        )
 
     def user_display(self) -> str:
         """
@@ -439,10 +520,7 @@ class Profile(Submission):
 
             pretty_phone_number = list(map(f, self.phone_number.split()[::-1]))
             out += f"شماره تماس: {' '.join(pretty_phone_number)}\n"
-        if self.faculty != "نامشخص":
-            out += f"دانشکده: {self.faculty}\n"
-        if self.university != "نامشخص":
-            out += f"دانشگاه: {self.university}\n"
+        out += self._format_fields(self._DISPLAY_FIELDS)
         # if self.owner_title != "ناشناس":
         #   out += f'نام ثبت کننده: {self.owner_title}\n'
         out += f"توضیحات:\n {self.description}\n"
@@ -480,6 +558,26 @@ class Media(Submission):
     professor = Column(String(30), nullable=False)  # Necessary field
     semester_year = Column(Integer, default=0)
 
+    _BULK_DEFAULTS = {
+        **Submission._BULK_DEFAULTS,
+        "media_type": "",
+        "course": "نامشخص",
+        "professor": "نامشخص",
+        "semester_year": 0,
+    }
+
+    _SEARCH_FIELDS = (
+        ("faculty", "نامشخص", " دانشکده {}"),
+        ("semester_year", 0, " سال {}"),
+        ("university", "نامشخص", " دانشگاه {}"),
+    )
+    _DISPLAY_FIELDS = (
+        ("semester_year", 0, "سال: {}\n"),
+        ("faculty", "نامشخص", "دانشکده: {}\n"),
+        ("university", "نامشخص", "دانشگاه: {}\n"),
+        ("owner_title", "ناشناس", "نام ثبت کننده: {}\n"),
+    )
+
     def __init__(
         self,
         owner,
@@ -513,13 +611,10 @@ class Media(Submission):
         """
         Updates the search text based on the course, professor, faculty, semester year, and university.
         """
-        self.search_text = f"فیلم درس {self.course} استاد {self.professor}"
-        if self.faculty != "نامشخص":
-            self.search_text += f" دانشکده {self.faculty}"
-        if self.semester_year != 0:
-            self.search_text += f" سال {self.semester_year}"
-        if self.university != "نامشخص":
-            self.search_text += f" دانشگاه {self.university}"
+        self.search_text = (
+            f"فیلم درس {self.course} استاد {self.professor}"
+            + self._format_fields(self._SEARCH_FIELDS)
+        )
 
     def user_display(self) -> str:
         """
@@ -530,14 +625,7 @@ class Media(Submission):
                  faculty, university, owner title, description, and ID.
         """
         out = f"عنوان: {self.course} استاد {self.professor}\n"
-        if self.semester_year != 0:
-            out += f"سال: {self.semester_year}\n"
-        if self.faculty != "نامشخص":
-            out += f"دانشکده: {self.faculty}\n"
-        if self.university != "نامشخص":
-            out += f"دانشگاه: {self.university}\n"
-        if self.owner_title != "ناشناس":
-            out += f"نام ثبت کننده: {self.owner_title}\n"
+        out += self._format_fields(self._DISPLAY_FIELDS)
         out += f"توضیحات:\n {self.description}\n"
         out += f"شماره رسانه: {self.id}\n"
         return out
@@ -575,3 +663,8 @@ def create_tables(engine) -> None:
     """
     BASE.metadata.bind = engine
     BASE.metadata.create_all(engine, checkfirst=True)
+    # create_all() skips tables that already exist, indexes included, so indexes
+    # added after a database was created are created here one by one
+    for table in BASE.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
@@ -1,7 +1,13 @@
+import atexit
+import logging
 import threading
+import time
 from datetime import datetime, timedelta
+from threading import Thread
 from typing import List
 
+from sqlalchemy import bindparam, update
+
 from uniland import SESSION, search_engine, usercache
 from uniland.db.tables import Submission, User, bookmarks_association
 from uniland.utils.enums import UserLevel
@@ -9,6 +15,10 @@ from uniland.utils.steps import UserSteps
 
 USER_INSERTION_LOCK = threading.RLock()
 
+USER_STEPS_FLUSH_INTERVAL = 0.2  # seconds
+PENDING_USER_STEPS_LOCK = threading.Lock()
+PENDING_USER_STEPS = {}  # int user_id -> latest step not yet written
+
 
 def add_user(user_id: int, last_step: str = UserSteps.START.value) -> User:
     """
@@ -30,7 +40,7 @@ def add_user(user_id: int, last_step: str = UserSteps.START.value) -> User:
         user = User(user_id, last_step=last_step)
         user.access_level = UserLevel.Ordinary
         usercache.add_user(user_id, 1, last_step)
-        print(f"added user: {str(user)}")
+        logging.info("added user: %s", user)
         SESSION.add(user)
         SESSION.commit()
         SESSION.close()
@@ -242,7 +252,10 @@ def remove_user_submission(user_id: int, submission: Submission) -> bool:
 
 def update_user_step(user_id: int, last_step: str) -> None:
     """
-    Update the last step of a user in the database.
+    Update the last step of a user.
+
+    The user cache is updated immediately; the database write is deferred and
+    coalesced per user by the background flusher.
 
     Args:
         user_id (int): The ID of the user.
@@ -251,14 +264,81 @@ def update_user_step(user_id: int, last_step: str) -> None:
     Returns:
         None
     """
-    with USER_INSERTION_LOCK:
-        if usercache.has_user(user_id):
-            SESSION.query(User).filter(User.user_id == user_id).update(
-                {User.last_step: last_step}, synchronize_session=False
-            )
-            SESSION.commit()
-            SESSION.close()
-            usercache.update_user_step(user_id, last_step)
+    # The cache mirrors the stored step, so an unchanged step needs no write
+    if usercache.has_user(user_id) and not usercache.match_step(user_id, last_step):
+        usercache.update_user_step(user_id, last_step)
+        with PENDING_USER_STEPS_LOCK:
+            PENDING_USER_STEPS[user_id] = last_step
+
+
+def get_pending_user_step(user_id: int) -> str:
+    """
+    Get the step of a user that is not written to the database yet.
+
+    Args:
+        user_id (int): The ID of the user.
+
+    Returns:
+        str: The pending step, or None if the stored step is up to date.
+    """
+    with PENDING_USER_STEPS_LOCK:
+        return PENDING_USER_STEPS.get(user_id)
+
+
+def flush_user_steps() -> None:
+    """
+    Write the latest pending step of every user to the database in one batch.
+
+    Returns:
+        None
+    """
+    with PENDING_USER_STEPS_LOCK:
+        if not PENDING_USER_STEPS:
+            return
+        drained = dict(PENDING_USER_STEPS)
+    # Core table statement, so the parameter list runs as a plain executemany
+    users = User.__table__
+    with SESSION() as session:
+        session.connection().execute(
+            update(users)
+            .where(users.c.user_id == bindparam("uid"))
+            .values(last_step=bindparam("step")),
+            [{"uid": uid, "step": step} for uid, step in drained.items()],
+        )
+        session.commit()
+    # Steps stay pending until committed, so a cache reload never misses them
+    with PENDING_USER_STEPS_LOCK:
+        for uid, step in drained.items():
+            if PENDING_USER_STEPS.get(uid) == step:
+                del PENDING_USER_STEPS[uid]
+
+
+def user_steps_flusher(interval: float = USER_STEPS_FLUSH_INTERVAL) -> None:
+    """
+    Periodically flushes the pending user steps.
+
+    Args:
+        interval (float, optional): Seconds between two flushes. Defaults to USER_STEPS_FLUSH_INTERVAL.
+
+    Returns:
+        None
+    """
+    while True:
+        time.sleep(interval)
+        try:
+            flush_user_steps()
+        except Exception as e:
+            print(e)
+
+
+def start_user_steps_flusher() -> None:
+    """
+    Starts the background flusher of pending user steps.
+
+    Returns:
+        None
+    """
+    Thread(target=user_steps_flusher, daemon=True).start()
 
 
 def update_user_activity(user_id: int) -> None:
@@ -383,22 +463,22 @@ def list_users() -> List[User]:
 
 def count_users() -> int:
     """
-    Counts the number of users in the user cache.
+    Counts the number of users in the database.
 
     Returns:
-        int: The number of users in the user cache.
+        int: The number of users.
     """
-    return len(usercache.users)
+    return SESSION.query(User).count()
 
 
 def count_admins() -> int:
     """
-    Counts the number of administrators in the user cache.
+    Counts the number of administrators.
 
     Returns:
         int: The number of administrators.
     """
-    return sum(1 for user in usercache.users.values() if user.permission == 3)
+    return SESSION.query(User).filter(User.access_level == UserLevel.Admin).count()
 
 
 def count_editors() -> int:
@@ -408,4 +488,8 @@ def count_editors() -> int:
     Returns:
         int: The number of users with editor permission.
     """
-    return sum(1 for user in usercache.users.values() if user.permission == 2)
+    return SESSION.query(User).filter(User.access_level == UserLevel.Editor).count()
+
+
+# Steps still pending when the process exits are written before shutdown
+atexit.register(flush_user_steps)
@@ -2,9 +2,9 @@ from pyrogram import Client, filters
 
 import uniland.db.user_methods as user_db
 from uniland import usercache
+from uniland.utils import messages
 from uniland.utils.builders import Builder
 from uniland.utils.filters import access_level, exact_match, user_step
-from uniland.utils.messages import Messages
 from uniland.utils.pages import Pages
 from uniland.utils.steps import UserSteps
 from uniland.utils.triggers import Triggers
@@ -32,9 +32,7 @@ async def edit_access_level(client, message) -> None:
     """
     user_step = UXTree.nodes[UserSteps.UPDATE_USER_ACCESS.value]
     messager_user_id = message.from_user.id
-    await message.reply(
-        text=Messages.ACCESS_LEVEL_BY_USERID.value, reply_markup=Pages.BACK
-    )
+    await message.reply(text=messages.ACCESS_LEVEL_BY_USERID, reply_markup=Pages.BACK)
     user_db.update_user_step(messager_user_id, user_step.step)
 
 
@@ -75,7 +73,7 @@ async def get_access_level(client, message) -> None:
         await message.reply("این یوزر آیدی وجود ندارد. دوباره تلاش کنید.")
         return
     user_step = UXTree.nodes[UserSteps.CHOOSE_USER_ACCESS_LEVEL.value]
-    output = Messages.ACCESS_LEVEL_CHOOSE.value
+    output = messages.ACCESS_LEVEL_CHOOSE
     await message.reply(
         text=output, reply_markup=Pages.ADMIN_PANEL_CHOOSE_NEW_ACCESS_LEVEL
     )
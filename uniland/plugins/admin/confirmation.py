@@ -3,9 +3,9 @@ from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 import uniland.db.submission_methods as subs_db
 import uniland.db.user_methods as user_db
+from uniland.utils import messages
 from uniland.utils.builders import Builder
 from uniland.utils.filters import access_level, exact_match, user_step
-from uniland.utils.messages import Messages
 from uniland.utils.steps import UserSteps
 from uniland.utils.triggers import Triggers
 from uniland.utils.uxhandler import UXTree
@@ -64,7 +64,7 @@ async def admin_confirmation(client, message):
     sub_id = 0
     sub = None
     if admin_id in reviewing_subs.values():  # admin reviewing
-        await message.reply(Messages.CONFIRMATION_FINISH_PREVIOUS_REVIEW.value)
+        await message.reply(messages.CONFIRMATION_FINISH_PREVIOUS_REVIEW)
         for dict_sub, dict_admin in reviewing_subs.items():
             if dict_admin == admin_id:
                 sub_id = dict_sub
@@ -77,7 +77,7 @@ async def admin_confirmation(client, message):
                 sub = subs_db.get_submission(sub_id)
                 break
     if sub_id == 0:  # new unconfirmed unreviewed submission not found
-        await message.reply(Messages.CONFIRMATION_NO_UNCONFIMRED_FILE.value)
+        await message.reply(messages.CONFIRMATION_NO_UNCONFIMRED_FILE)
     elif sub.submission_type == "document":  # found document
         reviewing_subs[sub_id] = admin_id
         await message.reply_document(
@@ -122,7 +122,7 @@ async def accept_submission(client, callback_query):
         await callback_query.answer(text="تایید شد. 🍾")
     else:  # already reviewed
         await callback_query.answer(
-            text=Messages.CONFIRMATION_ALREADY_REVIEWED.value, show_alert=True
+            text=messages.CONFIRMATION_ALREADY_REVIEWED, show_alert=True
         )
 
 
@@ -143,7 +143,7 @@ async def get_rejection_reason(client, callback_query):
     if sub_id not in reviewing_subs.keys():  # already reviewed
         await callback_query.edit_message_reply_markup([])
         await callback_query.answer(
-            text=Messages.CONFIRMATION_ALREADY_REVIEWED.value, show_alert=True
+            text=messages.CONFIRMATION_ALREADY_REVIEWED, show_alert=True
         )
     else:  # not reviewed
         await callback_query.edit_message_reply_markup([])
@@ -180,10 +180,10 @@ async def reject_submission(client, message):
             sub_id = dict_sub
     sub = subs_db.get_submission(sub_id)
     sub.update_search_text()
-    rejection_msg = Messages.CONFIRMATION_REJECTION_HEAD.value + "\n\n"
-    rejection_msg += Messages.CONFIRMATION_REJECTION_SUBMISSION.value
+    rejection_msg = messages.CONFIRMATION_REJECTION_HEAD + "\n\n"
+    rejection_msg += messages.CONFIRMATION_REJECTION_SUBMISSION
     rejection_msg += sub.search_text
-    rejection_msg += "\n\n" + Messages.CONFIRMATION_REJECTION_REASON.value
+    rejection_msg += "\n\n" + messages.CONFIRMATION_REJECTION_REASON
     rejection_msg += message.text
     try:
         await client.send_message(sub.owner_id, rejection_msg)
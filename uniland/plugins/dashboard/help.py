@@ -4,8 +4,8 @@ from copy import deepcopy
 from pyrogram import Client, filters
 from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
+from uniland.utils import messages
 from uniland.utils.filters import exact_match, user_step
-from uniland.utils.messages import Messages
 from uniland.utils.steps import UserSteps
 from uniland.utils.triggers import Triggers
 
@@ -75,101 +75,26 @@ async def display_help_menu(client, message):
     - None
     """
     await message.reply(
-        text=Messages.HELP_MENU.value,
+        text=messages.HELP_MENU,
         reply_markup=InlineKeyboardMarkup(get_keyboard(0)),
     )
 
 
-@Client.on_callback_query(filters.regex("helpmenu:back_to_help_menu"))
-async def back_to_menu(client, callback_query):
-    """
-    Callback function to handle the 'back_to_help_menu' button in the help menu.
-
-    Args:
-        client: The Telegram client.
-        callback_query: The callback query object.
-    """
-    await callback_query.edit_message_text(
-        Messages.HELP_MENU.value, reply_markup=InlineKeyboardMarkup(get_keyboard(0))
-    )
-
-
-@Client.on_callback_query(filters.regex("helpemenu:display_search_details"))
-async def search_help(client, callback_query):
-    """
-    Display search help menu.
-
-    Args:
-        client: The client object.
-        callback_query: The callback query object.
-
-    Returns:
-        None
-    """
-    await callback_query.edit_message_text(
-        Messages.HELP_MENU_SEARCH.value,
-        reply_markup=InlineKeyboardMarkup(get_keyboard(1)),
-    )
-
-
-@Client.on_callback_query(filters.regex("helpemenu:display_submit_details"))
-async def submit_help(client, callback_query):
-    """
-    Display the help menu for submitting details.
-
-    Args:
-        client: The client object.
-        callback_query: The callback query object.
-
-    Returns:
-        None
-    """
-    await callback_query.edit_message_text(
-        Messages.HELP_MENU_SUBMIT.value,
-        reply_markup=InlineKeyboardMarkup(get_keyboard(2)),
-    )
-
-
-@Client.on_callback_query(filters.regex("helpemenu:display_scores"))
-async def scores_help(client, callback_query):
-    """
-    Display the help menu for scores.
-
-    Args:
-        client: The Telegram client.
-        callback_query: The callback query.
-
-    Returns:
-        None
-    """
-    await callback_query.edit_message_text(
-        Messages.HELP_MENU_SCORES.value,
-        reply_markup=InlineKeyboardMarkup(get_keyboard(3)),
-    )
-
-
-@Client.on_callback_query(filters.regex("helpemenu:display_about_us"))
-async def about_us(client, callback_query):
-    """
-    Display information about us in the help menu.
-
-    Args:
-        client: The client object.
-        callback_query: The callback query object.
-
-    Returns:
-        None
-    """
-    await callback_query.edit_message_text(
-        Messages.HELP_MENU_ABOUT_US.value,
-        reply_markup=InlineKeyboardMarkup(get_keyboard(4)),
-    )
+# callback data -> (help text, index of the highlighted button)
+help_pages = {
+    "helpmenu:back_to_help_menu": (messages.HELP_MENU, 0),
+    "helpemenu:display_search_details": (messages.HELP_MENU_SEARCH, 1),
+    "helpemenu:display_submit_details": (messages.HELP_MENU_SUBMIT, 2),
+    "helpemenu:display_scores": (messages.HELP_MENU_SCORES, 3),
+    "helpemenu:display_about_us": (messages.HELP_MENU_ABOUT_US, 4),
+    "helpemenu:display_coming_soon": (messages.HELP_MENU_COMING_SOON, 5),
+}
 
 
-@Client.on_callback_query(filters.regex("helpemenu:display_coming_soon"))
-async def coming_soon(client, callback_query):
+@Client.on_callback_query(filters.regex("^helpe?menu:"))
+async def display_help_page(client, callback_query):
     """
-    Display a message indicating that the help menu is coming soon.
+    Display the help page selected from the help menu.
 
     Args:
         client: The client object.
@@ -178,7 +103,10 @@ async def coming_soon(client, callback_query):
     Returns:
         None
     """
+    page = help_pages.get(callback_query.data)
+    if page is None:
+        return
+    text, index = page
     await callback_query.edit_message_text(
-        Messages.HELP_MENU_COMING_SOON.value,
-        reply_markup=InlineKeyboardMarkup(get_keyboard(5)),
+        text, reply_markup=InlineKeyboardMarkup(get_keyboard(index))
     )
@@ -4,12 +4,58 @@ from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from uniland import usercache
 from uniland.db import user_methods as user_db
+from uniland.utils import messages
 from uniland.utils.builders import Builder
 from uniland.utils.filters import exact_match, user_step
-from uniland.utils.messages import Messages
 from uniland.utils.steps import UserSteps
 from uniland.utils.triggers import Triggers
 
+# Access level lines are fixed per level, so build them once
+access_level_messages = {
+    3: messages.MYPROFILE_ACCESS_LEVEL + "ادمین" + "\n\n",
+    2: messages.MYPROFILE_ACCESS_LEVEL + "ویرایشگر" + "\n\n",
+    1: messages.MYPROFILE_ACCESS_LEVEL + "کاربر عادی" + "\n\n",
+}
+unknown_access_level_message = messages.MYPROFILE_ACCESS_LEVEL + " " + "\n\n"
+
+
+def build_profile_text(user_id: int) -> str:
+    """
+    Build the profile summary of a user: access level, score, submissions and bookmarks.
+
+    Args:
+        user_id (int): The ID of the user.
+
+    Returns:
+        str: The profile summary text.
+    """
+    achieved_likes = usercache.get_achieved_likes(user_id)
+    submissions_count = user_db.count_user_submissions(user_id)
+    score_message = (
+        messages.MYPROFILE_SCORE
+        + str(achieved_likes + 5 * submissions_count)
+        + " ("
+        + str(submissions_count)
+        + " فایل ثبت شده، هریک 5 امتیاز و "
+        + str(achieved_likes)
+        + " لایک توسط کاربران"
+        + ")"
+        + "\n\n"
+    )
+    submitted_message = messages.SUBMISSIONS_COUNT + str(submissions_count) + "\n\n"
+    bookmark_message = (
+        messages.BOOKMARKS_TITLE + str(user_db.count_user_bookmarks(user_id)) + "\n\n"
+    )
+    access_level_message = unknown_access_level_message
+    for level, level_message in access_level_messages.items():
+        if usercache.has_permission(
+            user_id, min_permission=level, max_permission=level
+        ):
+            access_level_message = level_message
+            break
+
+    return access_level_message + score_message + submitted_message + bookmark_message
+
 
 @Client.on_message(
     filters.text
@@ -42,52 +88,7 @@ async def show_user_profile(client, message):
         ],
     ]
 
-    user_id = message.from_user.id
-    score_message = (
-        Messages.MYPROFILE_SCORE.value
-        + str(
-            usercache.get_achieved_likes(user_id)
-            + 5 * user_db.count_user_submissions(user_id)
-        )
-        + " ("
-        + str(user_db.count_user_submissions(user_id))
-        + " فایل ثبت شده، هریک 5 امتیاز و "
-        + str(usercache.get_achieved_likes(user_id))
-        + " لایک توسط کاربران"
-        + ")"
-        + "\n\n"
-    )
-    submitted_message = (
-        Messages.SUBMISSIONS_COUNT.value
-        + str(user_db.count_user_submissions(user_id))
-        + "\n\n"
-    )
-    bookmark_message = (
-        Messages.BOOKMARKS_TITLE.value
-        + str(user_db.count_user_bookmarks(user_id))
-        + "\n\n"
-    )
-    access_level_message = Messages.MYPROFILE_ACCESS_LEVEL.value + " " + "\n\n"
-    if usercache.has_permission(
-        message.from_user.id, min_permission=3, max_permission=3
-    ):
-        access_level_message = Messages.MYPROFILE_ACCESS_LEVEL.value + "ادمین" + "\n\n"
-    elif usercache.has_permission(
-        message.from_user.id, min_permission=2, max_permission=2
-    ):
-        access_level_message = (
-            Messages.MYPROFILE_ACCESS_LEVEL.value + "ویرایشگر" + "\n\n"
-        )
-    elif usercache.has_permission(
-        message.from_user.id, min_permission=1, max_permission=1
-    ):
-        access_level_message = (
-            Messages.MYPROFILE_ACCESS_LEVEL.value + "کاربر عادی" + "\n\n"
-        )
-
-    final_message = (
-        access_level_message + score_message + submitted_message + bookmark_message
-    )
+    final_message = build_profile_text(message.from_user.id)
     await message.reply(text=final_message, reply_markup=InlineKeyboardMarkup(buttons))
 
 
@@ -108,52 +109,7 @@ async def show_myprofile(client, callback_query):
         ],
     ]
 
-    user_id = callback_query.from_user.id
-    score_message = (
-        Messages.MYPROFILE_SCORE.value
-        + str(
-            usercache.get_achieved_likes(user_id)
-            + 5 * user_db.count_user_submissions(user_id)
-        )
-        + " ("
-        + str(user_db.count_user_submissions(user_id))
-        + " فایل ثبت شده، هریک 5 امتیاز و "
-        + str(usercache.get_achieved_likes(user_id))
-        + " لایک توسط کاربران"
-        + ")"
-        + "\n\n"
-    )
-    submitted_message = (
-        Messages.SUBMISSIONS_COUNT.value
-        + str(user_db.count_user_submissions(user_id))
-        + "\n\n"
-    )
-    bookmark_message = (
-        Messages.BOOKMARKS_TITLE.value
-        + str(user_db.count_user_bookmarks(user_id))
-        + "\n\n"
-    )
-    access_level_message = Messages.MYPROFILE_ACCESS_LEVEL.value + " " + "\n\n"
-    if usercache.has_permission(
-        callback_query.from_user.id, min_permission=3, max_permission=3
-    ):
-        access_level_message = Messages.MYPROFILE_ACCESS_LEVEL.value + "ادمین" + "\n\n"
-    elif usercache.has_permission(
-        callback_query.from_user.id, min_permission=2, max_permission=2
-    ):
-        access_level_message = (
-            Messages.MYPROFILE_ACCESS_LEVEL.value + "ویرایشگر" + "\n\n"
-        )
-    elif usercache.has_permission(
-        callback_query.from_user.id, min_permission=1, max_permission=1
-    ):
-        access_level_message = (
-            Messages.MYPROFILE_ACCESS_LEVEL.value + "کاربر عادی" + "\n\n"
-        )
-
-    final_message = (
-        access_level_message + score_message + submitted_message + bookmark_message
-    )
+    final_message = build_profile_text(callback_query.from_user.id)
     await callback_query.edit_message_text(
         text=final_message, reply_markup=InlineKeyboardMarkup(buttons)
     )
@@ -3,7 +3,7 @@
 from pyrogram import Client, filters
 from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
-from uniland import search_engine, usercache
+from uniland import search_engine
 from uniland.db import doc_methods as doc_db
 from uniland.db import media_methods as media_db
 from uniland.db import profile_methods as profile_db
@@ -42,7 +42,7 @@ async def count_actives(client, message):
 
 @Client.on_message(filters.text & filters.command("broadcast") & access_level(3, 3))
 async def public_announcement(client, message):
-    user_ids = usercache.users.keys()
+    user_ids = [user.user_id for user in user_db.list_users()]
     message.text = message.text.replace("/broadcast", "")
     keyboard = InlineKeyboardMarkup(
         [
@@ -1,3 +1,5 @@
+import re
+
 from pyrogram import Client, filters
 
 import uniland.db.user_methods as user_db
@@ -7,8 +9,12 @@ from uniland.utils import triggers, uxhandler
 from uniland.utils.builders import Builder
 from uniland.utils.steps import UserSteps
 
+BACK_PATTERN = re.compile(triggers.Triggers.BACK.value)
+START_STEP = UserSteps.START.value
+ADMIN_PANEL_STEP = UserSteps.ADMIN_PANEL.value
+
 
-@Client.on_message(filters.regex(triggers.Triggers.BACK.value) & filters.private)
+@Client.on_message(filters.regex(BACK_PATTERN) & filters.private)
 async def back_nav(client, message):
     """
     Handles the back navigation functionality when a user sends a message that matches the back trigger
@@ -23,11 +29,11 @@ async def back_nav(client, message):
     """
     step = usercache.get_last_step(message.from_user.id)
     user_step = uxhandler.UXTree.nodes[step]
-    if step == UserSteps.START.value:
+    if step == START_STEP:
         return
-    if user_step.parent.step == UserSteps.START.value:
+    if user_step.parent.step == START_STEP:
         await start_stage(client, message)
-    elif user_step.parent.step == UserSteps.ADMIN_PANEL.value:
+    elif user_step.parent.step == ADMIN_PANEL_STEP:
         text, keyboard = Builder.display_panel(message.from_user.id)
         await message.reply(text, reply_markup=keyboard)
         user_db.update_user_step(message.from_user.id, user_step.parent.step)
@@ -20,7 +20,7 @@ from uniland.db import profile_methods as profile_db
 from uniland.db import submission_methods as sub_db
 from uniland.db import user_methods as user_db
 from uniland.plugins.dashboard.help import get_keyboard
-from uniland.utils.messages import Messages
+from uniland.utils import messages
 from uniland.utils.steps import UserSteps
 
 
@@ -36,10 +36,7 @@ async def answer(client, inline_query):
     Returns:
         None
     """
-    ignored, records = search_engine.search(inline_query.query)
-
-    if len(records) > 50:
-        records = records[:50]
+    ignored, records = search_engine.search(inline_query.query, top_k=50)
 
     results = []
     for record in records:
@@ -149,7 +146,7 @@ async def answer(client, inline_query):
                 title="راهنما",
                 description=".موردی برای نمایش یافت نشد",
                 input_message_content=InputTextMessageContent(
-                    Messages.HELP_MENU_SEARCH.value
+                    messages.HELP_MENU_SEARCH
                 ),
                 id=-1,
                 reply_markup=InlineKeyboardMarkup(get_keyboard(1)),
@@ -1,3 +1,5 @@
+import re
+
 from pyrogram import Client, filters
 from pyrogram.enums import ParseMode
 from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
@@ -13,6 +15,8 @@ from uniland.utils.steps import UserSteps
 from uniland.utils.triggers import Triggers
 from uniland.utils.uxhandler import UXTree
 
+GET_SUBMISSION_PATTERN = re.compile(r"^/get_([a-z]+)_(\d+)")
+
 
 @Client.on_message(
     filters.text & user_step(UserSteps.START.value) & exact_match(Triggers.SEARCH.value)
@@ -141,7 +145,7 @@ async def pvsearch_callback(client, callback_query):
     )
 
 
-@Client.on_message(filters.text & filters.regex("^/get_") & ~filters.bot)
+@Client.on_message(filters.text & filters.regex(GET_SUBMISSION_PATTERN) & ~filters.bot)
 async def get_submission(client, message):
     """
     Retrieves a submission based on the provided submission type and ID,
@@ -154,7 +158,8 @@ async def get_submission(client, message):
     Returns:
         None
     """
-    submission_type, submission_id = message.text.split("_")[1:]
+    submission_type, submission_id = message.matches[0].groups()
+    submission_id = int(submission_id)
     submission = Builder.get_submission_child(submission_id, submission_type)
     if submission is None or not submission.is_confirmed:
         await message.reply(text="این رکورد وجود ندارد.")
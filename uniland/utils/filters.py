@@ -1,9 +1,12 @@
+from functools import lru_cache
+
 from pyrogram import filters
 from pyrogram.enums import ChatType
 
 from uniland import usercache
 
 
+@lru_cache(maxsize=None)
 def access_level(min: int = 1, max: int = 3):
     """
     Check if the user has the required access level.
@@ -24,6 +27,7 @@ def access_level(min: int = 1, max: int = 3):
     return filters.create(func)
 
 
+@lru_cache(maxsize=None)
 def user_step(step: str):
     """
     Check if the user's current step matches the given step.
@@ -34,6 +38,7 @@ def user_step(step: str):
     Returns:
         bool: True if the user's current step matches the given step, False otherwise.
     """
+    step = step.strip().lower()
 
     async def func(self, client, message):
         if message.chat.type != ChatType.PRIVATE:
@@ -63,6 +68,7 @@ async def user_existence_check(self, client, message):
 user_exists = filters.create(user_existence_check)
 
 
+@lru_cache(maxsize=None)
 def exact_match(txt: str):
     """
     Check if the message text is an exact match to the given text.
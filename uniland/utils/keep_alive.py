@@ -6,7 +6,8 @@ from threading import Thread
 import requests
 from flask import Flask
 
-from uniland import search_engine, usercache
+from uniland import search_engine
+from uniland.db import user_methods as user_db
 
 app = Flask("")
 
@@ -28,7 +29,7 @@ def home():
 def stats():
     return (
         f"Total Searches: {search_engine.total_searches}<br>"
-        f"Total Users: {usercache.total_users}<br>"
+        f"Total Users: {user_db.count_users()}<br>"
         f"Total confirmed Submissions: {search_engine.total_confirmed_subs}<br>"
     )
 
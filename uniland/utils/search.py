@@ -1,3 +1,8 @@
+import heapq
+
+from cachetools import TTLCache
+
+
 class SubmissionRecord:
     """
     Represents a submission record.
@@ -8,8 +13,11 @@ class SubmissionRecord:
         type (str): The type of the submission.
         likes (int): The number of likes the submission has received.
         search_times (int, optional): The number of times the submission has been searched. Defaults to 0.
+        tokens (frozenset): The distinct words of the search text, as stored in the index.
     """
 
+    __slots__ = ("id", "search_text", "type", "likes", "search_times", "tokens")
+
     def __init__(
         self, id: int, search_text: str, type: str, likes: int, search_times: int = 0
     ):
@@ -18,6 +26,7 @@ class SubmissionRecord:
         self.type = type
         self.likes = likes
         self.search_times = search_times
+        self.tokens = frozenset(search_text.split())
 
     def __repr__(self):
         return str(
@@ -39,9 +48,14 @@ class SearchEngine:
 
     Attributes:
         alts (dict): A dictionary mapping alternative characters to their replacements.
+        alts_table (dict): Translation table of the single-character entries of alts.
+        word_alts (tuple): The multi-character entries of alts as (key, value) pairs.
         subs (dict): A dictionary mapping record IDs to record objects.
         keywords (dict): A dictionary mapping keywords to sets of record IDs.
+        likes_of (dict): A dictionary mapping record IDs to their number of likes.
         total_searches (int): The total number of searches performed.
+        generation (int): Bumped on every index change so stale cached results are never hit.
+        results_cache (TTLCache): Recent search results keyed by (query, top_k, generation).
 
     Methods:
         __init__: Initializes a new instance of the SearchEngine class.
@@ -58,6 +72,15 @@ class SearchEngine:
         __repr__: Returns a string representation of the SearchEngine object.
     """
 
+    __slots__ = (
+        "subs",
+        "keywords",
+        "likes_of",
+        "total_searches",
+        "generation",
+        "results_cache",
+    )
+
     alts = {
         "ي": "ی",
         "ك": "ک",
@@ -98,6 +121,10 @@ class SearchEngine:
         "پروفایل": "اطلاعات",
         "ن‌ن"[1]: " ",  # Nim Fasele:)
     }
+    # Single characters are mapped in one C-level pass; only the multi-character
+    # alternatives still need a replace() each.
+    alts_table = str.maketrans({k: v for k, v in alts.items() if len(k) == 1})
+    word_alts = tuple((k, v) for k, v in alts.items() if len(k) > 1)
 
     def __init__(self):
         """
@@ -108,11 +135,17 @@ class SearchEngine:
         Attributes:
         - subs: A dictionary mapping integer IDs to Record objects.
         - keywords: A dictionary mapping string keywords to sets of integer IDs.
+        - likes_of: A dictionary mapping integer IDs to their number of likes.
         - total_searches: An integer representing the total number of searches performed.
+        - generation: An integer bumped whenever the index changes.
+        - results_cache: A TTL cache of recent search results.
         """
         self.subs = {}  # int id -> Record record
         self.keywords = {}  # str keyword -> set of int ids
+        self.likes_of = {}  # int id -> likes, kept alongside subs for ranking
         self.total_searches = 0
+        self.generation = 0
+        self.results_cache = TTLCache(maxsize=2048, ttl=60)
 
     def __clean_text(self, text: str):
         """
@@ -125,9 +158,9 @@ class SearchEngine:
         Returns:
             str: The cleaned text.
         """
-        text = " " + text + " "
+        text = (" " + text + " ").translate(self.alts_table)
 
-        for key, value in self.alts.items():
+        for key, value in self.word_alts:
             text = text.replace(key, value)
 
         text = " ".join(text.split())
@@ -153,8 +186,10 @@ class SearchEngine:
             search_times (int, optional): The number of times the record has been searched. Defaults to 0.
         """
         self.total_searches += search_times
+        self.generation += 1
 
         search_text = self.__clean_text(search_text)
+        self.likes_of[id] = likes
 
         if search_text is None:
             self.subs[id] = SubmissionRecord(
@@ -168,11 +203,8 @@ class SearchEngine:
 
         self.subs[id] = record
 
-        for word in search_text.split():
-            if word not in self.keywords:
-                self.keywords[word] = set()
-
-            self.keywords[word].add(record)
+        for word in record.tokens:
+            self.keywords.setdefault(word, set()).add(id)
 
     def update_record(
         self, id: int, search_text: str = None, sub_type: str = None, likes: int = -1
@@ -186,6 +218,12 @@ class SearchEngine:
             sub_type (str, optional): The new sub type for the record. Defaults to None.
             likes (int, optional): The new number of likes for the record. Defaults to -1.
         """
+        if search_text is None and sub_type is None:
+            # Only the likes change, so the index itself needs no update
+            if likes != -1:
+                self.subs[id].likes = self.likes_of[id] = likes
+            return
+
         record = self.remove_record(id)
 
         record.search_text = record.search_text if search_text is None else search_text
@@ -204,6 +242,7 @@ class SearchEngine:
             id (int): The ID of the subscription to increase the likes for.
         """
         self.subs[id].likes += 1
+        self.likes_of[id] += 1
 
     def decrease_likes(self, id: int):
         """
@@ -213,6 +252,7 @@ class SearchEngine:
             id (int): The ID of the item to decrease the likes for.
         """
         self.subs[id].likes -= 1
+        self.likes_of[id] -= 1
 
     def get_likes(self, id: int):
         """
@@ -254,26 +294,27 @@ class SearchEngine:
 
         """
         record = self.subs.pop(id)
+        del self.likes_of[id]
 
         self.total_searches -= record.search_times
+        self.generation += 1
 
-        search_text = record.search_text
-
-        for word in search_text.split():
+        for word in record.tokens:
             if word in self.keywords:
-                self.keywords[word].discard(record)
+                self.keywords[word].discard(id)
 
                 if len(self.keywords[word]) == 0:
                     del self.keywords[word]
 
         return record
 
-    def search(self, search_text: str):
+    def search(self, search_text: str, top_k: int = None):
         """
         Search for keywords in the given search text and return the sorted results.
 
         Args:
             search_text (str): The text to search for keywords.
+            top_k (int, optional): Only return the `top_k` most liked results. Defaults to None (all results).
 
         Returns:
             tuple: A tuple containing a boolean value indicating whether any ignored keywords were found,
@@ -281,22 +322,37 @@ class SearchEngine:
         """
         search_text = self.__clean_text(search_text)
 
-        result = set()
-
-        first_flag = True
-        ignored_keyword = False
-
-        for word in search_text.split():
-            if word in self.keywords:
-                if not first_flag:
-                    result = result.intersection(self.keywords[word])
-                else:
-                    result = self.keywords[word]
-                    first_flag = False
-            else:
-                ignored_keyword = True
-
-        return (ignored_keyword, sorted(result, key=lambda x: x.likes, reverse=True))
+        # Like changes do not bump the generation, so a cached ordering may lag
+        # behind them for at most the cache TTL.
+        key = (search_text, top_k, self.generation)
+        cached = self.results_cache.get(key)
+        if cached is not None:
+            return cached
+
+        words = frozenset(search_text.split())
+        postings = [self.keywords[word] for word in words if word in self.keywords]
+        ignored_keyword = len(postings) != len(words)
+
+        if not postings:
+            result = self.results_cache[key] = (ignored_keyword, [])
+            return result
+
+        # Intersecting from the smallest posting set keeps the intermediate result
+        # small. intersection() always builds a new set, so the index is never mutated.
+        postings.sort(key=len)
+        result = postings[0].intersection(*postings[1:])
+
+        # Ranking on the ids with the bound dict lookup avoids a lambda call per
+        # comparison; only the ranked ids are resolved to records.
+        likes_of = self.likes_of.__getitem__
+        if top_k is not None:
+            ids = heapq.nlargest(top_k, result, key=likes_of)
+        else:
+            ids = sorted(result, key=likes_of, reverse=True)
+        records = [self.subs[id] for id in ids]
+
+        result = self.results_cache[key] = (ignored_keyword, records)
+        return result
 
     def __repr__(self):
         return f"SearchEngine with {len(self.subs)} records and {len(self.keywords)} keywords"
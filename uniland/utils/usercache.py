@@ -1,9 +1,14 @@
+from cachetools import TTLCache
+
+from uniland.utils.enums import UserLevel
+
+
 class UserRecord:
     """
     Represents a user record with information such as user ID, permission level, last step, and achieved likes.
     """
 
-    permission_values = {"Admin": 3, "Editor": 2, "Ordinary": 1}
+    __slots__ = ("user_id", "permission", "last_step", "achieved_likes")
 
     def __init__(
         self, user_id: int, permission, last_step: str, achieved_likes: int = 0
@@ -27,12 +32,13 @@ class UserRecord:
         Updates the permission level of the user.
 
         Args:
-            permission (str or int): The new permission level. Can be a string value ("Admin", "Editor", "Ordinary") or an integer value.
+            permission (str, int or UserLevel): The new permission level. Can be a UserLevel name ("Admin", "Editor", "Ordinary"), a UserLevel or an integer value.
         """
-        if permission in self.permission_values.keys():
-            self.permission = self.permission_values[permission]
-        else:
-            self.permission = permission
+        if isinstance(permission, str):
+            permission = UserLevel[permission].value
+        elif isinstance(permission, UserLevel):
+            permission = permission.value
+        self.permission = permission
 
     def has_permission(self, min_permission: int = 1, max_permission: int = 3):
         """
@@ -70,8 +76,14 @@ class UserCache:
     """
     A class that represents a cache of user records.
 
+    The cache is bounded: it holds at most `maxsize` users and each entry expires
+    `ttl` seconds after it was added. Evicted users are loaded again through
+    `loader` on their next access.
+
     Attributes:
-        users (dict): A dictionary that maps user IDs to UserRecord objects.
+        users (TTLCache): A mapping of user IDs to UserRecord objects.
+        loader (callable): Optional read-through loader used on cache misses. Called with
+            a user ID, it returns a `(permission, last_step, achieved_likes)` tuple or None.
 
     Methods:
         add_user(user_id, permission, last_step): Adds a new user to the cache.
@@ -88,10 +100,33 @@ class UserCache:
         get_last_step(user_id): Returns the last step of a user.
     """
 
-    def __init__(self):
-        self.users = {}  # int id -> UserRecord
+    __slots__ = ("users", "loader")
+
+    def __init__(self, loader=None, maxsize: int = 100_000, ttl: int = 3600):
+        self.users = TTLCache(maxsize=maxsize, ttl=ttl)  # int id -> UserRecord
+        self.loader = loader
+
+    def _get_user(self, user_id: int):
+        """
+        Returns the record of a user, loading it through `loader` on a cache miss.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            UserRecord or None: The user record, or None if the user does not exist.
+        """
+        user = self.users.get(user_id)
+        if user is None and self.loader is not None:
+            loaded = self.loader(user_id)
+            if loaded is not None:
+                self.add_user(user_id, *loaded)
+                user = self.users[user_id]
+        return user
 
-    def add_user(self, user_id: int, permission, last_step: str):
+    def add_user(
+        self, user_id: int, permission, last_step: str, achieved_likes: int = 0
+    ):
         """
         Adds a new user to the cache.
 
@@ -99,8 +134,9 @@ class UserCache:
             user_id (int): The ID of the user.
             permission: The permission level of the user.
             last_step (str): The last step performed by the user.
+            achieved_likes (int, optional): The likes achieved by the user. Defaults to 0.
         """
-        user = UserRecord(user_id, permission, last_step)
+        user = UserRecord(user_id, permission, last_step, achieved_likes)
 
         self.users[user_id] = user
 
@@ -164,9 +200,10 @@ class UserCache:
         Returns:
             int: The achieved likes of the user.
         """
-        if user_id not in self.users:
+        user = self._get_user(user_id)
+        if user is None:
             return 0
-        return self.users[user_id].achieved_likes
+        return user.achieved_likes
 
     @property
     def total_users(self):
@@ -205,7 +242,7 @@ class UserCache:
         Returns:
             bool: True if the user exists, False otherwise.
         """
-        return user_id in self.users
+        return self._get_user(user_id) is not None
 
     def match_step(self, user_id: int, step: str):
         """
@@ -213,14 +250,16 @@ class UserCache:
 
         Args:
             user_id (int): The ID of the user.
-            step (str): The step to match.
+            step (str): The step to match, already stripped and lowercased
+                (as all `UserSteps` values are).
 
         Returns:
             bool: True if the user's last step matches the given step, False otherwise.
         """
-        if user_id not in self.users:
+        user = self._get_user(user_id)
+        if user is None:
             return False
-        return self.users[user_id].last_step == step.strip().lower()
+        return user.last_step == step
 
     def has_permission(
         self, user_id: int, min_permission: int = 1, max_permission: int = 3
@@ -236,9 +275,10 @@ class UserCache:
         Returns:
             bool: True if the user has a permission level within the given range, False otherwise.
         """
-        if user_id not in self.users:
+        user = self._get_user(user_id)
+        if user is None:
             return False
-        return self.users[user_id].has_permission(min_permission, max_permission)
+        return user.has_permission(min_permission, max_permission)
 
     def get_last_step(self, user_id: int):
         """
@@ -250,7 +290,7 @@ class UserCache:
         Returns:
             str: The last step performed by the user.
         """
-        return self.users[user_id].last_step
+        return self._get_user(user_id).last_step
 
     def __repr__(self):
         return f"UserCache with {len(self.users)} users"
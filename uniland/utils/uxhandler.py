@@ -1,4 +1,4 @@
-from uniland.utils.messages import Messages
+from uniland.utils import messages
 from uniland.utils.pages import Pages
 from uniland.utils.steps import UserSteps
 from uniland.utils.triggers import Triggers
@@ -326,7 +326,7 @@ class UXTree:
     nodes[UserSteps.UPDATE_USER_ACCESS.value] = UXNode(
         step=UserSteps.UPDATE_USER_ACCESS.value,
         parent=nodes[UserSteps.ADMIN_PANEL.value],
-        description=Messages.ACCESS_LEVEL_BY_USERID.value,
+        description=messages.ACCESS_LEVEL_BY_USERID,
         keyboard=Pages.BACK,
         trigger="تغییر سطح دسترسی کاربران",
     )